@@ -4,18 +4,170 @@ import plotly.graph_objs as go
 from crew import run_analysis
 import json
 import pandas as pd
-from crewai import CrewOutput
-from ui.agent_display import (
-    display_technical_analysis,
-    display_fundamental_analysis,
-    display_risk_assessment,
-    display_investment_strategy
-)
-import pandas_market_calendars as mcal
+import numpy as np
 from datetime import date
 
+
+# (label, info key, format spec) for the key statistics table
+KEY_STATISTICS = (
+    ("Market Cap", "marketCap", "${:,}"),
+    ("P/E Ratio", "trailingPE", "{:.2f}"),
+    ("52 Week High", "fiftyTwoWeekHigh", "${:,.2f}"),
+    ("52 Week Low", "fiftyTwoWeekLow", "${:,.2f}"),
+    ("Dividend Yield", "dividendYield", "{:.2%}"),
+    ("Beta", "beta", "{:.2f}"),
+)
+
+# (description keyword, report field) used to route each task output to its tab
+TASK_ROUTES = (
+    ("technical analysis", "technical_analysis"),
+    ("fundamental analysis", "fundamental_analysis"),
+    ("risk assessment", "risk_assessment"),
+    ("investment strategy", "investment_strategy"),
+)
+
+
+def _fmt(info, key, spec):
+    """Formats info[key] with spec, or returns 'N/A' when the value is missing."""
+    value = info.get(key)
+    return spec.format(value) if value else "N/A"
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _get_info(symbol):
+    """
+    Fetches the yfinance info dict for a symbol, cached across reruns.
+    Raises on a missing or incomplete result so the failure is not cached.
+    """
+    info = yf.Ticker(symbol).info
+    if not info or info.get('regularMarketPrice') is None:
+        raise ValueError(f"No key statistics returned for {symbol}")
+    return info
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _get_history(symbol):
+    """
+    Fetches one year of price history for a symbol, cached across reruns.
+    Only the OHLCV columns the chart uses are kept, with Volume as int64.
+    Raises on an empty result so the failure is not cached.
+    """
+    hist = yf.Ticker(symbol).history(period="1y")
+    if hist.empty:
+        raise ValueError(f"No price history returned for {symbol}")
+    hist = hist[['Open', 'High', 'Low', 'Close', 'Volume']]
+    return hist.astype({'Volume': 'int64'}) if hist['Volume'].notna().all() else hist
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_run_analysis(symbol: str, period: str = "1y") -> dict:
+    """
+    Runs the analysis crew once per (symbol, period) and caches the task outputs.
+    CrewOutput is not reliably picklable, so the result is reduced to a plain
+    dict mapping each task description to its raw output. A run without task
+    outputs raises instead, so the failure is not cached.
+    """
+    result = run_analysis(symbol, period)
+    if not getattr(result, 'tasks_output', None):
+        raise ValueError(f"The analysis crew returned no task outputs for {symbol}")
+    return {task_output.description: task_output.raw for task_output in result.tasks_output}
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _non_trading_days(start: date, end: date) -> list[str]:
+    """
+    Returns NYSE non-trading business days between start and end as ISO strings.
+    These are business days missing from the official schedule (holidays etc.).
+    """
+    # Imported lazily: loading the calendar package is slow and the landing page never needs it
+    import pandas_market_calendars as mcal
+
+    nyse = mcal.get_calendar('NYSE')
+    schedule = nyse.schedule(start_date=start, end_date=end)
+    all_days = set(pd.date_range(start=start, end=end, freq='B').date)
+    return sorted(d.strftime('%Y-%m-%d') for d in (all_days - set(schedule.index.date)))
+
+
+def _moving_averages(close, windows):
+    """
+    Computes simple moving averages for several windows from one cumulative sum,
+    so the Close series is scanned once instead of once per window. As with
+    rolling(window).mean(), only windows containing a missing Close are NaN.
+    """
+    close = np.asarray(close, dtype=float)
+    valid = ~np.isnan(close)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, close, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    averages = {}
+    for window in windows:
+        ma = np.full(len(close), np.nan)
+        if len(close) >= window:
+            full = (ccount[window:] - ccount[:-window]) == window
+            ma[window - 1:] = np.where(full, (csum[window:] - csum[:-window]) / window, np.nan)
+        averages[window] = ma
+    return averages
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _build_price_chart(symbol, last_ts):
+    """
+    Builds the candlestick/volume/moving-average chart for a symbol and returns
+    it as a plain dict, so reruns reuse the serialized figure instead of
+    rebuilding every trace. last_ts is only part of the cache key.
+    """
+    hist = _get_history(symbol)
+
+    # Get the start and end dates from the historical data
+    start_date = hist.index.min().date()
+    end_date = hist.index.max().date()
+
+    # Create range breaks for weekends and market holidays/non-trading days
+    rangebreaks = [
+        dict(bounds=["sat", "mon"]),
+        dict(values=_non_trading_days(start_date, end_date))
+    ]
+
+    # Pull the OHLCV columns out as plain arrays once; Plotly serializes numpy
+    # arrays directly without going through per-Series pandas conversion.
+    idx = hist.index
+    open_, high, low, close = hist[['Open', 'High', 'Low', 'Close']].to_numpy().T
+    volume = hist['Volume'].to_numpy()
+
+    fig = go.Figure()
+    fig.add_trace(go.Candlestick(x=idx,
+                                 open=open_,
+                                 high=high,
+                                 low=low,
+                                 close=close,
+                                 name='Price'))
+
+    fig.add_trace(go.Bar(x=idx, y=volume, name='Volume', yaxis='y2', marker_color='rgba(0,100,180,0.4)'))
+    ma = _moving_averages(close, (20, 50, 200))
+    fig.add_trace(go.Scatter(x=idx, y=ma[20], name='20-day MA', line=dict(color='green')))
+    fig.add_trace(go.Scatter(x=idx, y=ma[50], name='50-day MA', line=dict(color='orange')))
+    fig.add_trace(go.Scatter(x=idx, y=ma[200], name='200-day MA', line=dict(color='purple')))
+
+    fig.update_layout(
+        title=f"{symbol} Price, Volume, and Moving Averages (1 Year)",
+        yaxis_title='Price (USD)',
+        yaxis2=dict(title='Volume', overlaying='y', side='right', showgrid=False),
+        xaxis_rangeslider_visible=False,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    fig.update_xaxes(rangebreaks=rangebreaks)
+    return fig.to_dict()
+
+
 def display_report(analysis):
     """Displays the analysis report using Streamlit tabs."""
+    from ui.agent_display import (
+        display_technical_analysis,
+        display_fundamental_analysis,
+        display_risk_assessment,
+        display_investment_strategy,
+        parse_outputs
+    )
+
     st.header("AI Analysis Report")
 
     tab_titles = [
@@ -24,99 +176,98 @@ def display_report(analysis):
         "⚖️ Risk Assessment",
         "📈 Investment Strategy"
     ]
+    technical, fundamental, risk, strategy = parse_outputs([
+        analysis.get(field, {}) for _, field in TASK_ROUTES
+    ])
     tabs = st.tabs(tab_titles)
 
     with tabs[0]:
         st.subheader("Technical Analysis")
-        display_technical_analysis(analysis.get('technical_analysis', {}))
+        display_technical_analysis(technical)
 
     with tabs[1]:
         st.subheader("Fundamental Analysis")
-        display_fundamental_analysis(analysis.get('fundamental_analysis', {}))
+        display_fundamental_analysis(fundamental)
 
     with tabs[2]:
         st.subheader("Risk Assessment")
-        display_risk_assessment(analysis.get('risk_assessment', {}))
+        display_risk_assessment(risk)
 
     with tabs[3]:
         st.subheader("Investment Strategy & Recommendation")
-        display_investment_strategy(analysis.get('investment_strategy', {}))
+        display_investment_strategy(strategy)
 
 
 
 def display_stock_data(stock_symbol):
     """Fetches and displays stock data and chart."""
     st.header(f"Live Stock Data for {stock_symbol}")
-    stock = yf.Ticker(stock_symbol)
-    
+
     st.subheader("Key Statistics")
-    info = stock.info
-    
-    # Ensure info is not empty
-    if not info or info.get('regularMarketPrice') is None:
+    try:
+        info = _get_info(stock_symbol)
+    except ValueError:
         st.warning(f"Could not retrieve key statistics for {stock_symbol}. The symbol may be invalid or delisted.")
         return
 
-    stats_data = {
-        "Metric": ["Market Cap", "P/E Ratio", "52 Week High", "52 Week Low", "Dividend Yield", "Beta"],
-        "Value": [
-            f"${info.get('marketCap', 0):,}" if info.get('marketCap') else "N/A",
-            str(round(info.get('trailingPE', 0), 2)) if info.get('trailingPE') else "N/A",
-            f"${info.get('fiftyTwoWeekHigh', 0):,.2f}" if info.get('fiftyTwoWeekHigh') else "N/A",
-            f"${info.get('fiftyTwoWeekLow', 0):,.2f}" if info.get('fiftyTwoWeekLow') else "N/A",
-            f"{info.get('dividendYield', 0):.2%}" if info.get('dividendYield') else "N/A",
-            str(round(info.get('beta', 0), 2)) if info.get('beta') else "N/A"
-        ]
-    }
-    stats_df = pd.DataFrame(stats_data)
-    st.table(stats_df.set_index('Metric'))
+    stats = pd.Series(
+        [_fmt(info, key, spec) for _, key, spec in KEY_STATISTICS],
+        index=pd.Index([label for label, _, _ in KEY_STATISTICS], name='Metric'),
+        name='Value'
+    )
+    st.table(stats)
 
     st.subheader("Interactive Stock Chart")
-    hist = stock.history(period="1y")
-    if hist.empty:
+    try:
+        hist = _get_history(stock_symbol)
+    except ValueError:
         st.warning(f"Could not retrieve historical data for {stock_symbol}.")
         return
 
-    # Get the start and end dates from the historical data
-    start_date = hist.index.min().date()
-    end_date = hist.index.max().date()
+    # Keyed by the latest bar so a new session's data invalidates the cached figure
+    fig = _build_price_chart(stock_symbol, hist.index[-1])
+    st.plotly_chart(fig, use_container_width=True)
 
-    # Get all official US market holidays and early closes using pandas_market_calendars
-    nyse = mcal.get_calendar('NYSE')
-    schedule = nyse.schedule(start_date=start_date, end_date=end_date)
-    all_trading_days = set(schedule.index.date)
-    all_days = set(pd.date_range(start=start_date, end=end_date, freq='B').date)
-    # Non-trading days are business days not in trading days
-    non_trading_days = sorted(list(all_days - all_trading_days))
 
-    # Create range breaks for weekends and market holidays/non-trading days
-    rangebreaks = [
-        dict(bounds=["sat", "mon"]),
-        dict(values=[d.strftime('%Y-%m-%d') for d in non_trading_days])
-    ]
+@st.fragment
+def analysis_panel(stock_symbol):
+    """
+    Runs the crew for a symbol and renders the stock data and report.
+    Wrapped in a fragment so reruns triggered inside it stay scoped to this block.
+    """
+    st.header(f"Analysis for {stock_symbol}")
+    with st.spinner(f"🚀 Launching AI crew to analyze {stock_symbol}... This may take a few minutes."):
+        result = None
+        try:
+            result = cached_run_analysis(stock_symbol)
 
-    fig = go.Figure()
-    fig.add_trace(go.Candlestick(x=hist.index,
-                                 open=hist['Open'],
-                                 high=hist['High'],
-                                 low=hist['Low'],
-                                 close=hist['Close'],
-                                 name='Price'))
+            analysis = {
+                "technical_analysis": "",
+                "fundamental_analysis": "",
+                "risk_assessment": "",
+                "investment_strategy": ""
+            }
 
-    fig.add_trace(go.Bar(x=hist.index, y=hist['Volume'], name='Volume', yaxis='y2', marker_color='rgba(0,100,180,0.4)'))
-    fig.add_trace(go.Scatter(x=hist.index, y=hist['Close'].rolling(window=20).mean(), name='20-day MA', line=dict(color='green')))
-    fig.add_trace(go.Scatter(x=hist.index, y=hist['Close'].rolling(window=50).mean(), name='50-day MA', line=dict(color='orange')))
-    fig.add_trace(go.Scatter(x=hist.index, y=hist['Close'].rolling(window=200).mean(), name='200-day MA', line=dict(color='purple')))
+            # Extract outputs from each task
+            for description, raw in result.items():
+                task_desc = description.lower()
+                for keyword, field in TASK_ROUTES:
+                    if keyword in task_desc:
+                        analysis[field] = raw
+                        break
 
-    fig.update_layout(
-        title=f"{stock_symbol} Price, Volume, and Moving Averages (1 Year)",
-        yaxis_title='Price (USD)',
-        yaxis2=dict(title='Volume', overlaying='y', side='right', showgrid=False),
-        xaxis_rangeslider_visible=False,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
-    fig.update_xaxes(rangebreaks=rangebreaks)
-    st.plotly_chart(fig, use_container_width=True)
+            display_stock_data(stock_symbol)
+            display_report(analysis)
+
+        except json.JSONDecodeError:
+            st.error("Failed to decode the analysis report. The crew's output was not valid JSON.")
+            st.subheader("Raw Output from AI Crew:")
+            st.text_area("Raw Output", "\n\n".join(result.values()) if result else "No output.", height=300)
+        except Exception as e:
+            st.error(f"An unexpected error occurred: {e}")
+            if result:
+                st.subheader("Raw Output from AI Crew:")
+                st.text_area("Raw Output", "\n\n".join(result.values()), height=300)
 
 
 def main():
@@ -135,46 +286,7 @@ def main():
     st.title("AI-Powered Stock Analysis Crew")
 
     if analyze_button:
-        st.header(f"Analysis for {stock_symbol}")
-        with st.spinner(f"🚀 Launching AI crew to analyze {stock_symbol}... This may take a few minutes."):
-            result = None
-            try:
-                result = run_analysis(stock_symbol)
-                
-                analysis = {
-                    "technical_analysis": "",
-                    "fundamental_analysis": "",
-                    "risk_assessment": "",
-                    "investment_strategy": ""
-                }
-
-                # Extract outputs from each task
-                if hasattr(result, 'tasks_output'):
-                    for task_output in result.tasks_output:
-                        task_desc = task_output.description.lower()
-                        if "technical analysis" in task_desc:
-                            analysis["technical_analysis"] = task_output.raw
-                        elif "fundamental analysis" in task_desc:
-                            analysis["fundamental_analysis"] = task_output.raw
-                        elif "risk assessment" in task_desc:
-                            analysis["risk_assessment"] = task_output.raw
-                        elif "investment strategy" in task_desc:
-                            analysis["investment_strategy"] = task_output.raw
-                else:
-                    st.error("Failed to retrieve task outputs from crew result")
-
-                display_stock_data(stock_symbol)
-                display_report(analysis)
-
-            except json.JSONDecodeError:
-                st.error("Failed to decode the analysis report. The crew's output was not valid JSON.")
-                st.subheader("Raw Output from AI Crew:")
-                st.text_area("Raw Output", result.raw if result else "No output.", height=300)
-            except Exception as e:
-                st.error(f"An unexpected error occurred: {e}")
-                if result:
-                    st.subheader("Raw Output from AI Crew:")
-                    st.text_area("Raw Output", result.raw if result else "No output.", height=300)
+        analysis_panel(stock_symbol)
     else:
         st.markdown("Enter a stock symbol in the sidebar to get a comprehensive analysis from a team of AI agents.")
         st.info("Select a stock from the sidebar and click 'Analyze' to begin.")
@@ -1,9 +1,15 @@
 from crewai import Agent, Crew, Process, Task, LLM
 from crewai.project import CrewBase, agent, crew, task
 from dotenv import load_dotenv
+import functools
 import os
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Load environment variables
 load_dotenv()
 
@@ -11,14 +17,26 @@ load_dotenv()
 from tools.tech_analysis import TechAnalystTool
 from tools.fundamental_analysis import FundamentalAnalysisTool
 from tools.risk_assessment import RiskAssessmentTool
+from tools.market_data import prefetch
 
 from crewai import Agent, Crew, Process, Task, LLM, CrewOutput
 
+@functools.lru_cache(maxsize=None)
+def _load_yaml(path: str, mtime: float) -> dict:
+    """
+    Parses a YAML config file. Cached per (path, mtime) so repeated crew
+    instantiations reuse the parsed config until the file changes on disk.
+    """
+    with open(path, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
 def run_analysis(stock_symbol: str, period: str = "1y") -> CrewOutput:
     """
     Runs the financial analysis crew for a given stock symbol.
     """
     inputs = {'ticker': stock_symbol, 'period': period}
+    # Fetch the tools' market data concurrently up front so their calls hit the cache
+    prefetch(stock_symbol, period)
     quant_crew = QuantCrew()
     result = quant_crew.crew().kickoff(inputs=inputs)
     return result
@@ -42,10 +60,8 @@ class QuantCrew:
         agents_config_path = os.path.join(script_dir, self.agents_config)
         tasks_config_path = os.path.join(script_dir, self.tasks_config)
 
-        with open(agents_config_path, 'r') as file:
-            self._agents_def = yaml.safe_load(file)
-        with open(tasks_config_path, 'r') as file:
-            self._tasks_def = yaml.safe_load(file)
+        self._agents_def = _load_yaml(agents_config_path, os.path.getmtime(agents_config_path))
+        self._tasks_def = _load_yaml(tasks_config_path, os.path.getmtime(tasks_config_path))
 
         # Instantiate agents once
         self.technical_analyst_agent = self.technical_analyst()
@@ -53,6 +69,13 @@ class QuantCrew:
         self.risk_analyst_agent = self.risk_analyst()
         self.investment_strategist_agent = self.investment_strategist()
 
+        # Instantiate tasks once so the strategy task's context and the crew's
+        # task list refer to the same Task objects
+        self.apply_technical_analysis_task = self.apply_technical_analysis()
+        self.analyze_fundamentals_task = self.analyze_fundamentals()
+        self.assess_risk_task = self.assess_risk()
+        self.develop_investment_strategy_task = self.develop_investment_strategy()
+
     @agent
     def technical_analyst(self) -> Agent:
         return Agent(
@@ -132,9 +155,9 @@ class QuantCrew:
             expected_output=self._tasks_def['develop_investment_strategy']['expected_output'],
             agent=self.investment_strategist_agent,
             context=[
-                self.apply_technical_analysis(),
-                self.analyze_fundamentals(),
-                self.assess_risk()
+                self.apply_technical_analysis_task,
+                self.analyze_fundamentals_task,
+                self.assess_risk_task
             ]
         )
 
@@ -148,11 +171,15 @@ class QuantCrew:
                 self.risk_analyst_agent,
                 self.investment_strategist_agent
             ],
+            # The three analyst tasks are async and contiguous, so the sequential
+            # process starts them together and only joins them when it reaches
+            # the synchronous strategy task. Keep them ahead of it to preserve
+            # the overlap.
             tasks=[
-                self.analyze_fundamentals(),
-                self.apply_technical_analysis(),
-                self.assess_risk(),
-                self.develop_investment_strategy()
+                self.analyze_fundamentals_task,
+                self.apply_technical_analysis_task,
+                self.assess_risk_task,
+                self.develop_investment_strategy_task
             ],
             process=Process.sequential,
             verbose=True,
@@ -0,0 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+import functools
+
+
+@functools.cache
+def shared_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide thread pool for blocking fetches and parsing. It is created
+    on first use and never shut down, so callers reuse its threads instead of paying
+    for thread start-up on every call.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='quantcrew')
@@ -0,0 +1,7 @@
+try:
+    from numba import njit
+except ImportError:  # numba is a requirement; this fallback only keeps the modules importable, far slower
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,10 @@
+import orjson
+
+
+def to_json(result: dict) -> str:
+    """
+    Serializes a tool result for the agents. orjson encodes numpy scalars and arrays
+    natively (NaN becomes null), so values reach the LLM as plain JSON numbers
+    instead of reprs like np.float64(1.23).
+    """
+    return orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY).decode()
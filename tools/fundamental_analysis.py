@@ -1,47 +1,50 @@
 from crewai.tools import BaseTool
-import yfinance as yf
 import pandas as pd
 
+from tools._serialize import to_json
+from tools.market_data import get_info, get_statements
+
 class FundamentalAnalysisTool(BaseTool):
     name: str = "Fundamental Analysis Tool"
     description: str = "Performs comprehensive fundamental analysis on a given stock ticker, returning key financial metrics and ratios."
 
-    def _run(self, ticker: str) -> dict:
+    def _run(self, ticker: str) -> str:
         """
         Perform comprehensive fundamental analysis on a given stock ticker.
-        Returns key financial metrics, ratios, and reasoning.
+        Returns key financial metrics, ratios, and reasoning as a JSON string.
         """
-        stock = yf.Ticker(ticker)
+        return to_json(self._analyze(ticker))
+
+    def _analyze(self, ticker: str) -> dict:
+        """Builds the fundamental analysis result dict for a ticker."""
         try:
-            info = stock.info
-            if not info or info.get('trailingPE') is None:
+            info = get_info(ticker)
+            if info.get('trailingPE') is None:
                 return {"error": f"Could not retrieve valid financial info for {ticker}. It may be an invalid ticker."}
-            financials = stock.financials
-            balance_sheet = stock.balance_sheet
-            cash_flow = stock.cashflow
-            if financials.empty or balance_sheet.empty or cash_flow.empty:
-                return {"error": f"Could not retrieve complete financial statements for {ticker}."}
+            financials, balance_sheet, cash_flow = get_statements(ticker)
         except Exception as e:
             return {"error": f"Failed to retrieve data for {ticker} from yfinance: {e}"}
 
-        def get_latest(df, key):
-            if key in df.index and not df.loc[key].empty:
-                return df.loc[key].iloc[0]
-            return None
-
         try:
-            total_current_assets = get_latest(balance_sheet, 'Total Current Assets')
-            total_current_liabilities = get_latest(balance_sheet, 'Total Current Liabilities')
-            total_liabilities = get_latest(balance_sheet, 'Total Liabilities Net Minority Interest')
-            total_equity = get_latest(balance_sheet, 'Total Equity Gross Minority Interest')
-            net_income = get_latest(financials, 'Net Income')
-            total_assets = get_latest(balance_sheet, 'Total Assets')
-            total_revenue = get_latest(financials, 'Total Revenue')
-            operating_cash_flow = get_latest(cash_flow, 'Operating Cash Flow')
-            capital_expenditures = get_latest(cash_flow, 'Capital Expenditure')
+            # Latest-period value of every line item, built once per statement so
+            # each lookup below is a plain dict access instead of a .loc call
+            latest_financials = dict(zip(financials.index, financials.iloc[:, 0]))
+            latest_balance_sheet = dict(zip(balance_sheet.index, balance_sheet.iloc[:, 0]))
+            latest_cash_flow = dict(zip(cash_flow.index, cash_flow.iloc[:, 0]))
+
+            total_current_assets = latest_balance_sheet.get('Total Current Assets')
+            total_current_liabilities = latest_balance_sheet.get('Total Current Liabilities')
+            total_liabilities = latest_balance_sheet.get('Total Liabilities Net Minority Interest')
+            total_equity = latest_balance_sheet.get('Total Equity Gross Minority Interest')
+            net_income = latest_financials.get('Net Income')
+            total_assets = latest_balance_sheet.get('Total Assets')
+            total_revenue = latest_financials.get('Total Revenue')
+            operating_cash_flow = latest_cash_flow.get('Operating Cash Flow')
+            capital_expenditures = latest_cash_flow.get('Capital Expenditure')
 
-            prev_total_revenue = financials.loc['Total Revenue'].iloc[1] if len(financials.loc['Total Revenue']) > 1 else None
-            prev_net_income = financials.loc['Net Income'].iloc[1] if len(financials.loc['Net Income']) > 1 else None
+            prev_financials = dict(zip(financials.index, financials.iloc[:, 1])) if financials.shape[1] > 1 else {}
+            prev_total_revenue = prev_financials.get('Total Revenue')
+            prev_net_income = prev_financials.get('Net Income')
 
             current_ratio = total_current_assets / total_current_liabilities if total_current_liabilities else None
             debt_to_equity = total_liabilities / total_equity if total_equity else None
@@ -0,0 +1,126 @@
+from datetime import date
+from functools import lru_cache
+import os
+import time
+
+import pandas as pd
+
+from tools._executor import shared_executor
+
+# Shared, per-day cached yfinance lookups for the analysis tools.
+# Cached objects are shared between callers and must not be modified in place.
+# Failed lookups raise instead of returning empty results so they are not cached.
+# yfinance is imported inside the fetchers so importing the tools stays cheap.
+
+# Price history is also persisted here so it survives process restarts
+HISTORY_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+HISTORY_CACHE_TTL = 86400  # seconds
+
+
+def get_info(ticker: str) -> dict:
+    """Returns the yfinance info dict for a ticker, cached for the current day."""
+    return _get_info(ticker, date.today())
+
+
+def get_statements(ticker: str) -> tuple:
+    """Returns (financials, balance_sheet, cash_flow) for a ticker, cached for the current day."""
+    return _get_statements(ticker, date.today())
+
+
+def get_history(ticker: str, period: str = "1y"):
+    """
+    Returns daily price history for a ticker, cached per period for the current day,
+    in memory and as parquet under HISTORY_CACHE_DIR.
+    """
+    return _get_history(ticker, period, date.today())
+
+
+def fetch_bundle(tickers, period: str = "1y") -> dict:
+    """
+    Downloads daily price history for several tickers in a single yfinance request.
+    Returns a dict mapping each ticker to its OHLCV DataFrame; tickers without data are omitted.
+    Bundles are cached per (tickers, period) for the current day.
+    """
+    symbols = tuple(dict.fromkeys(tickers))
+    return dict(_download_bundle(symbols, period, date.today()))
+
+
+def prefetch(ticker: str, period: str = "1y", benchmark: str = "^GSPC", risk_period: str = "5y") -> None:
+    """
+    Warms the caches for everything the analysis tools fetch for a ticker, running the
+    independent HTTP requests concurrently. Failures are ignored; the tools report them.
+    """
+    fetches = [
+        (get_info, (ticker,)),
+        (get_statements, (ticker,)),
+        (get_history, (ticker, period)),
+        (fetch_bundle, ([ticker, benchmark], risk_period)),
+    ]
+    executor = shared_executor()
+    futures = [executor.submit(fn, *args) for fn, args in fetches]
+    for future in futures:
+        future.exception()
+
+
+# One yf.Ticker per symbol per day, shared by the fetchers below so they reuse its lazily
+# loaded state; it is rebuilt daily because yfinance caches data on the instance.
+@lru_cache(maxsize=128)
+def _get_ticker(symbol: str, day: date):
+    import yfinance as yf
+
+    return yf.Ticker(symbol)
+
+
+@lru_cache(maxsize=256)
+def _get_info(ticker: str, day: date) -> dict:
+    info = _get_ticker(ticker, day).info
+    if not info:
+        raise ValueError(f"No info returned for {ticker}")
+    return info
+
+
+@lru_cache(maxsize=256)
+def _get_statements(ticker: str, day: date) -> tuple:
+    stock = _get_ticker(ticker, day)
+    statements = (stock.financials, stock.balance_sheet, stock.cashflow)
+    if any(df.empty for df in statements):
+        raise ValueError(f"Incomplete financial statements returned for {ticker}")
+    return statements
+
+
+@lru_cache(maxsize=256)
+def _get_history(ticker: str, period: str, day: date):
+    path = os.path.join(HISTORY_CACHE_DIR, f"{ticker.replace(os.sep, '_')}_{period}.parquet")
+    try:
+        if time.time() - os.path.getmtime(path) < HISTORY_CACHE_TTL:
+            return pd.read_parquet(path)
+    except Exception:
+        pass  # missing, stale or unreadable cache file; fetch from the network
+
+    history = _get_ticker(ticker, day).history(period=period)
+    if history.empty:
+        raise ValueError(f"No data found for ticker {ticker} and period {period}")
+    try:
+        os.makedirs(HISTORY_CACHE_DIR, exist_ok=True)
+        history.to_parquet(path)
+    except Exception:
+        pass  # the disk cache is best effort
+    return history
+
+
+@lru_cache(maxsize=64)
+def _download_bundle(symbols: tuple, period: str, day: date) -> tuple:
+    import yfinance as yf
+
+    data = yf.download(list(symbols), period=period, group_by='ticker', threads=True, progress=False)
+    if data.empty:
+        raise ValueError(f"No price data returned for {', '.join(symbols)}")
+    available = set(data.columns.get_level_values(0))
+    bundle = []
+    for symbol in symbols:
+        if symbol not in available:
+            continue
+        frame = data[symbol].dropna(how='all')
+        if not frame.empty:
+            bundle.append((symbol, frame))
+    return tuple(bundle)
@@ -1,8 +1,67 @@
 from crewai.tools import BaseTool
-import yfinance as yf
 import numpy as np
 import pandas as pd
 
+from tools._njit import njit
+from tools._serialize import to_json
+from tools.market_data import fetch_bundle
+
+
+@njit(cache=True)
+def risk_metrics(stock_returns, benchmark_returns, risk_free_daily):
+    """
+    Computes beta, Sharpe ratio, 95% historical VaR, maximum drawdown and annualized
+    volatility in a single pass over the daily returns. Moments are accumulated in
+    float64 with Welford updates; VaR keeps only the smallest returns needed for the
+    5th percentile (linear interpolation, as np.percentile).
+    """
+    n = stock_returns.shape[0]
+    position = (n - 1) * 0.05
+    lower = int(np.floor(position))
+    upper = min(lower + 1, n - 1)
+    smallest = np.full(upper + 1, np.inf)
+
+    mean_s = mean_b = 0.0
+    m2_s = m2_b = co_moment = 0.0
+    cumulative = peak = 1.0
+    max_drawdown = 0.0
+    for i in range(n):
+        r_s = np.float64(stock_returns[i])
+        r_b = np.float64(benchmark_returns[i])
+
+        delta_s = r_s - mean_s
+        delta_b = r_b - mean_b
+        mean_s += delta_s / (i + 1)
+        mean_b += delta_b / (i + 1)
+        m2_s += delta_s * (r_s - mean_s)
+        m2_b += delta_b * (r_b - mean_b)
+        co_moment += delta_s * (r_b - mean_b)
+
+        cumulative *= 1.0 + r_s
+        if i == 0 or cumulative > peak:
+            peak = cumulative
+        drawdown = (cumulative - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+        # Insert into the ascending buffer of the smallest returns seen so far
+        if r_s < smallest[upper]:
+            j = upper
+            while j > 0 and smallest[j - 1] > r_s:
+                smallest[j] = smallest[j - 1]
+                j -= 1
+            smallest[j] = r_s
+
+    if n < 2:
+        return np.nan, np.nan, smallest[0], max_drawdown, np.nan
+    std_s = np.sqrt(m2_s / (n - 1))
+    var_b = m2_b / (n - 1)
+    beta = (co_moment / (n - 1)) / var_b if var_b != 0 else 0.0
+    sharpe = np.sqrt(252.0) * (mean_s - risk_free_daily) / std_s if std_s != 0 else 0.0
+    var_95 = smallest[lower] + (smallest[upper] - smallest[lower]) * (position - lower)
+    return beta, sharpe, var_95, max_drawdown, std_s * np.sqrt(252.0)
+
+
 class RiskAssessmentTool(BaseTool):
     name: str = "Risk Assessment Tool"
     description: str = (
@@ -10,29 +69,32 @@ class RiskAssessmentTool(BaseTool):
         "The benchmark ticker must be a valid symbol from Yahoo Finance (e.g., '^GSPC' for S&P 500)."
     )
 
-    def _run(self, ticker: str, benchmark: str = "^GSPC", period: str = "5y") -> dict:
+    def _run(self, ticker: str, benchmark: str = "^GSPC", period: str = "5y") -> str:
         """
-        Perform risk assessment for a given stock. Returns metrics and reasoning.
+        Perform risk assessment for a given stock. Returns metrics and reasoning as a JSON string.
         """
+        return to_json(self._analyze(ticker, benchmark, period))
+
+    def _analyze(self, ticker: str, benchmark: str, period: str) -> dict:
+        """Builds the risk assessment result dict for a ticker against a benchmark."""
         try:
-            data = yf.download([ticker, benchmark], period=period, progress=False)['Close']
-            if data.empty or ticker not in data or benchmark not in data or data[ticker].isnull().all() or data[benchmark].isnull().all():
-                 return {"error": f"Could not retrieve valid data for {ticker} or {benchmark}."}
+            bundle = fetch_bundle([ticker, benchmark], period)
+            if ticker not in bundle or benchmark not in bundle:
+                return {"error": f"Could not retrieve valid data for {ticker} or {benchmark}."}
+            # float32 halves the bytes scanned for returns; the metrics are reported
+            # to at most 4 decimals, well within its precision
+            data = pd.concat({ticker: bundle[ticker]['Close'], benchmark: bundle[benchmark]['Close']}, axis=1).astype(np.float32)
+            if data[ticker].isnull().all() or data[benchmark].isnull().all():
+                return {"error": f"Could not retrieve valid data for {ticker} or {benchmark}."}
             returns = data.pct_change().dropna()
             if returns.empty:
                 return {"error": "Not enough data to calculate returns."}
-            covariance = returns[ticker].cov(returns[benchmark])
-            benchmark_variance = returns[benchmark].var()
-            beta = covariance / benchmark_variance if benchmark_variance != 0 else 0
             risk_free_rate = 0.02
-            excess_returns = returns[ticker] - (risk_free_rate / 252)
-            sharpe_ratio = np.sqrt(252) * excess_returns.mean() / excess_returns.std() if excess_returns.std() != 0 else 0
-            var_95 = np.percentile(returns[ticker], 5)
-            cumulative_returns = (1 + returns[ticker]).cumprod()
-            peak = cumulative_returns.cummax()
-            drawdown = (cumulative_returns - peak) / peak
-            max_drawdown = drawdown.min()
-            volatility = round(returns[ticker].std() * np.sqrt(252), 4)
+            beta, sharpe_ratio, var_95, max_drawdown, volatility = risk_metrics(
+                returns[ticker].to_numpy(), returns[benchmark].to_numpy(), risk_free_rate / 252
+            )
+            volatility = round(float(volatility), 4)
+            beta, sharpe_ratio, var_95, max_drawdown = (float(v) for v in (beta, sharpe_ratio, var_95, max_drawdown))
 
             # Generate reasoning string
             reasoning = (
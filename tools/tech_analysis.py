@@ -1,15 +1,230 @@
-import yfinance as yf
+import asyncio
+from collections import OrderedDict
+
 import numpy as np
-from scipy.signal import find_peaks
+import pandas as pd
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
 
-from ta.trend import SMAIndicator, MACD
-from ta.momentum import RSIIndicator
-from ta.volatility import BollingerBands
-from ta.volume import OnBalanceVolumeIndicator
+from tools._executor import shared_executor
+from tools._njit import njit
+from tools._serialize import to_json
+from tools.market_data import get_history
+
+
+@njit(cache=True)
+def compute_indicators(close, volume):
+    """
+    Computes every trend, volatility, momentum and volume indicator in a single pass
+    over the close prices, reproducing the `ta` package definitions:
+    SMA 20/50/200, MACD (12, 26, 9), the (10, 20, 9) MACD histogram, Bollinger Bands (20, 2),
+    Wilder RSI (14) and on-balance volume. Values are NaN until each indicator's
+    window is filled, except the Bollinger high-band indicator, which is 0.
+    """
+    n = close.shape[0]
+    sma_20 = np.full(n, np.nan)
+    sma_50 = np.full(n, np.nan)
+    sma_200 = np.full(n, np.nan)
+    bb_high = np.full(n, np.nan)
+    bb_low = np.full(n, np.nan)
+    bb_high_ind = np.zeros(n)
+    macd = np.full(n, np.nan)
+    macd_signal = np.full(n, np.nan)
+    macd_diff = np.full(n, np.nan)
+    macd_diff_20 = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    obv = np.empty(n)
+
+    alpha_12, alpha_26, alpha_9 = 2.0 / 13.0, 2.0 / 27.0, 2.0 / 10.0
+    alpha_10, alpha_20 = 2.0 / 11.0, 2.0 / 21.0
+    alpha_rsi = 1.0 / 14.0
+
+    sum_20 = sum_sq_20 = sum_50 = sum_200 = 0.0
+    ema_12 = ema_26 = ema_10 = ema_20 = 0.0
+    signal = signal_20 = 0.0
+    avg_gain = avg_loss = 0.0
+    running_obv = 0.0
+
+    for i in range(n):
+        price = close[i]
+
+        # Simple moving averages and Bollinger Bands from running window sums
+        sum_20 += price
+        sum_sq_20 += price * price
+        sum_50 += price
+        sum_200 += price
+        if i >= 20:
+            old = close[i - 20]
+            sum_20 -= old
+            sum_sq_20 -= old * old
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        if i >= 200:
+            sum_200 -= close[i - 200]
+        if i >= 19:
+            mean = sum_20 / 20.0
+            std = np.sqrt(max(sum_sq_20 / 20.0 - mean * mean, 0.0))
+            sma_20[i] = mean
+            bb_high[i] = mean + 2.0 * std
+            bb_low[i] = mean - 2.0 * std
+            if price > bb_high[i]:
+                bb_high_ind[i] = 1.0
+        if i >= 49:
+            sma_50[i] = sum_50 / 50.0
+        if i >= 199:
+            sma_200[i] = sum_200 / 200.0
+
+        # Exponential moving averages for both MACD variants
+        if i == 0:
+            ema_12 = ema_26 = ema_10 = ema_20 = price
+        else:
+            ema_12 += alpha_12 * (price - ema_12)
+            ema_26 += alpha_26 * (price - ema_26)
+            ema_10 += alpha_10 * (price - ema_10)
+            ema_20 += alpha_20 * (price - ema_20)
+        if i >= 25:
+            line = ema_12 - ema_26
+            signal = line if i == 25 else signal + alpha_9 * (line - signal)
+            macd[i] = line
+            if i >= 33:
+                macd_signal[i] = signal
+                macd_diff[i] = line - signal
+        if i >= 19:
+            line = ema_10 - ema_20
+            signal_20 = line if i == 19 else signal_20 + alpha_9 * (line - signal_20)
+            if i >= 27:
+                macd_diff_20[i] = line - signal_20
+
+        # Wilder-smoothed RSI and on-balance volume
+        change = price - close[i - 1] if i > 0 else 0.0
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if i == 0:
+            avg_gain, avg_loss = gain, loss
+        else:
+            avg_gain += alpha_rsi * (gain - avg_gain)
+            avg_loss += alpha_rsi * (loss - avg_loss)
+        if i >= 13:
+            rsi[i] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        running_obv += -volume[i] if change < 0.0 else volume[i]
+        obv[i] = running_obv
+
+    return (sma_20, sma_50, sma_200, bb_high, bb_low, bb_high_ind,
+            macd, macd_signal, macd_diff, macd_diff_20, rsi, obv)
+
+
+def latest_vol_mom(close, window):
+    """
+    Returns the annualized volatility of the last `window` simple returns and the
+    price change over those bars. Only the latest values are reported, so just the
+    trailing window is read. Both are NaN until a full window of returns exists.
+    """
+    if close.shape[0] <= window:
+        return np.nan, np.nan
+    tail = close[-window - 1:]
+    returns = tail[1:] / tail[:-1] - 1.0
+    return np.std(returns, ddof=1) * np.sqrt(252.0), tail[-1] - tail[0]
+
+
+@njit(cache=True)
+def _select_extrema(x, sign, min_distance):
+    """
+    Returns the indices of local maxima of sign * x that are at least min_distance
+    apart, using the same rules as scipy.signal.find_peaks(distance=...): flat peaks
+    resolve to their middle sample, and when two peaks are too close the higher wins.
+    Equal heights are ranked with a stable sort, so the later peak wins the tie, with
+    or without numba. find_peaks' unstable sort can settle some ties the other way.
+    """
+    n = x.shape[0]
+    candidates = np.empty(max(n // 2, 1), dtype=np.int64)
+    count = 0
+    i = 1
+    while i < n - 1:
+        if sign * x[i - 1] < sign * x[i]:
+            ahead = i + 1
+            while ahead < n - 1 and x[ahead] == x[i]:
+                ahead += 1
+            if sign * x[ahead] < sign * x[i]:
+                candidates[count] = (i + ahead - 1) // 2
+                count += 1
+                i = ahead
+        i += 1
+    peaks = candidates[:count]
+
+    keep = np.ones(count, dtype=np.bool_)
+    order = np.argsort(sign * x[peaks], kind='mergesort')
+    for rank in range(count - 1, -1, -1):
+        j = order[rank]
+        if not keep[j]:
+            continue
+        k = j - 1
+        while k >= 0 and peaks[j] - peaks[k] < min_distance:
+            keep[k] = False
+            k -= 1
+        k = j + 1
+        while k < count and peaks[k] - peaks[j] < min_distance:
+            keep[k] = False
+            k += 1
+    return peaks[keep]
+
+
+def last_k_extrema(x, min_distance, k):
+    """
+    Returns the values of the last k peaks and the last k troughs of x, in time order.
+    """
+    peaks = _select_extrema(x, 1.0, min_distance)
+    troughs = _select_extrema(x, -1.0, min_distance)
+    return x[peaks[-k:]], x[troughs[-k:]]
+
+
+def _trend_rule(above_sma_50, below_sma_50, sma_50_above_200, sma_50_below_200):
+    if above_sma_50 and sma_50_above_200:
+        return "Strong Uptrend"
+    elif above_sma_50 and sma_50_below_200:
+        return "Potential Uptrend"
+    elif below_sma_50 and sma_50_below_200:
+        return "Strong Downtrend"
+    elif below_sma_50 and sma_50_above_200:
+        return "Potential Downtrend"
+    return "Neutral"
+
+
+def _signal_rule(rsi_below_30, rsi_below_40, rsi_above_60, rsi_above_70,
+                 macd_positive, macd_negative, below_lower_bb, above_upper_bb):
+    if rsi_below_30 and macd_positive and below_lower_bb:
+        return "Strong Buy"
+    elif rsi_below_40 and macd_positive:
+        return "Buy"
+    elif rsi_above_70 and macd_negative and above_upper_bb:
+        return "Strong Sell"
+    elif rsi_above_60 and macd_negative:
+        return "Sell"
+    return "Hold"
+
+
+def _rule_table(rule, n_bits):
+    """Evaluates a rule for every combination of its boolean conditions, indexed by bitmask."""
+    return tuple(rule(*((code >> bit) & 1 for bit in range(n_bits))) for code in range(1 << n_bits))
+
+
+# Decision tables: bit i of the index is the i-th condition of the rule above
+_TREND_TABLE = _rule_table(_trend_rule, 4)
+_SIGNAL_TABLE = _rule_table(_signal_rule, 8)
+
+
+_REASONING_TMPL = (
+    "Technical analysis for {ticker} over {period}:\n"
+    "Current price is {current_price}. "
+    "Trend is {trend}. Signal is {signal}. "
+    "RSI: {rsi}, "
+    "MACD: {macd}, "
+    "Support levels: {support_levels}, "
+    "Resistance levels: {resistance_levels}. "
+    "Volatility: {volatility}, Momentum: {momentum}."
+)
+_REASONING_INDICATORS = ('current_price', 'rsi', 'macd', 'support_levels', 'resistance_levels', 'volatility', 'momentum')
 
 
 class TechAnalysisInput(BaseModel):
@@ -23,11 +238,15 @@ class TechAnalystTool(BaseTool):
     description: str = "Perform technical analysis on a given stock symbol"
     args_schema: Type[BaseModel] = TechAnalysisInput
 
-    def _run(self, ticker: str, period: str = "1y") -> dict:
+    def _run(self, ticker: str, period: str = "1y") -> str:
         """
         Executes the technical analysis for a given stock ticker.
-        Returns indicators, trend, signal, and reasoning.
+        Returns indicators, trend, signal, and reasoning as a JSON string.
         """
+        return to_json(self._analyze(ticker, period))
+
+    def _analyze(self, ticker: str, period: str) -> dict:
+        """Builds the technical analysis result dict for a ticker."""
         try:
             analyst = TechAnalyst(ticker, period)
             analyst.fetch_and_process_data()
@@ -39,16 +258,9 @@ class TechAnalystTool(BaseTool):
             signal = analyst.generate_signal()
 
             # Generate reasoning string
-            reasoning = (
-                f"Technical analysis for {ticker} over {period}:\n"
-                f"Current price is {indicators.get('current_price', 'N/A')}. "
-                f"Trend is {trend}. Signal is {signal}. "
-                f"RSI: {indicators.get('rsi', 'N/A')}, "
-                f"MACD: {indicators.get('macd', 'N/A')}, "
-                f"Support levels: {indicators.get('support_levels', [])}, "
-                f"Resistance levels: {indicators.get('resistance_levels', [])}. "
-                f"Volatility: {indicators.get('volatility', 'N/A')}, Momentum: {indicators.get('momentum', 'N/A')}."
-            )
+            params = {'ticker': ticker, 'period': period, 'trend': trend, 'signal': signal}
+            params.update((key, indicators.get(key, 'N/A')) for key in _REASONING_INDICATORS)
+            reasoning = _REASONING_TMPL.format_map(params)
 
             return {
                 "indicators": indicators,
@@ -59,9 +271,18 @@ class TechAnalystTool(BaseTool):
         except Exception as e:
             return {"error": str(e)}
 
-    async def _arun(self, ticker: str, period: str = "1y") -> dict:
-        # The async version simply wraps the synchronous run method.
-        return self._run(ticker, period)
+    async def _arun(self, ticker: str, period: str = "1y") -> str:
+        # The download and indicator work is blocking, so run it on a worker thread
+        # to keep the event loop free for other tool calls.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(shared_executor(), self._run, ticker, period)
+
+
+# Processed indicator frames keyed by (ticker, period, rows, last close), so repeat
+# tool calls on unchanged history skip the indicator pipeline. Oldest entries are
+# evicted once the cache holds _INDICATOR_CACHE_SIZE frames.
+_INDICATOR_CACHE: OrderedDict = OrderedDict()
+_INDICATOR_CACHE_SIZE = 32
 
 
 class TechAnalyst:
@@ -74,6 +295,7 @@ class TechAnalyst:
         self.ticker = ticker
         self.period = period
         self.df = None
+        self._last = {}
 
     def fetch_and_process_data(self):
         """
@@ -81,50 +303,71 @@ class TechAnalyst:
         This method consolidates all data processing and indicator calculations into one place.
         """
         try:
-            stock = yf.Ticker(self.ticker)
-            history = stock.history(period=self.period)
-            if history.empty:
-                raise ValueError(f"No data found for ticker {self.ticker} and period {self.period}")
-
-            df = history.copy()
-
-            # Consolidated indicator calculations
-            if len(df) >= 200:
-                df['trend_sma_200'] = SMAIndicator(close=df['Close'], window=200).sma_indicator()
-            if len(df) >= 50:
-                df['trend_sma_50'] = SMAIndicator(close=df['Close'], window=50).sma_indicator()
-            if len(df) >= 20:
-                df['trend_sma_20'] = SMAIndicator(close=df['Close'], window=20).sma_indicator()
-            if len(df) >= 26:  # MACD requirements
-                macd = MACD(close=df['Close'], window_slow=26, window_fast=12, window_sign=9)
-                df['trend_macd'] = macd.macd()
-                df['trend_macd_signal'] = macd.macd_signal()
-                df['trend_macd_diff'] = macd.macd_diff()
-            if len(df) >= 20:  # MACD 20 day
-                macd_20 = MACD(close=df['Close'], window_slow=20, window_fast=10, window_sign=9)
-                df['trend_macd_20'] = macd_20.macd()
-                df['trend_macd_signal_20'] = macd_20.macd_signal()
-                df['trend_macd_diff_20'] = macd_20.macd_diff()
-            if len(df) >= 20:  # Bollinger Bands requirements
-                bb = BollingerBands(close=df['Close'], window=20, window_dev=2)
-                df['volatility_bbhi'] = bb.bollinger_hband_indicator()
-                df['volatility_bbh'] = bb.bollinger_hband()
-                df['volatility_bbl'] = bb.bollinger_lband()
-                df['volatility_bbm'] = bb.bollinger_mavg()
-            if len(df) >= 14:  # RSI requirements
-                df['momentum_rsi'] = RSIIndicator(close=df['Close'], window=14).rsi()
-            if 'Volume' in df.columns:
-                df['volume_obv'] = OnBalanceVolumeIndicator(close=df['Close'], volume=df['Volume']).on_balance_volume()
-
-            # Volatility and Momentum calculations are now part of the main processing
-            if len(df) >= 20:
-                df['volatility'] = df['Close'].pct_change().rolling(window=20).std() * np.sqrt(252)
-                df['momentum'] = df['Close'] - df['Close'].shift(20)
-            else:
-                df['volatility'] = np.nan
-                df['momentum'] = np.nan
-
-            self.df = df.dropna()
+            history = get_history(self.ticker, self.period)
+            # The kernels assume a gap-free Close: a single NaN would poison every running
+            # sum and EMA after it, so bars without a close are dropped once up front
+            if history['Close'].isna().any():
+                history = history.dropna(subset=['Close'])
+            # Below the RSI window no indicator has a value, so skip the pipeline
+            if len(history) < 14:
+                raise ValueError(f"Insufficient history ({len(history)} bars) for {self.ticker}")
+            key = (self.ticker, self.period, len(history), float(history['Close'].iloc[-1]))
+            if key in _INDICATOR_CACHE:
+                _INDICATOR_CACHE.move_to_end(key)
+                self.df, self._last = _INDICATOR_CACHE[key]
+                return
+
+            # Columns are gathered as arrays and the frame is built once at the end,
+            # instead of inserting into a DataFrame column by column
+            cols = {name: history[name].to_numpy() for name in history.columns}
+            n = len(history)
+
+            # Consolidated indicator calculations, computed in one pass over Close
+            close = history['Close'].to_numpy(dtype=np.float64)
+            volume = history['Volume'].to_numpy(dtype=np.float64) if 'Volume' in cols else np.zeros(n)
+            (sma_20, sma_50, sma_200, bb_high, bb_low, bb_high_ind,
+             macd, macd_signal, macd_diff, macd_diff_20, rsi, obv) = compute_indicators(close, volume)
+
+            if n >= 200:
+                cols['trend_sma_200'] = sma_200
+            if n >= 50:
+                cols['trend_sma_50'] = sma_50
+            if n >= 20:
+                cols['trend_sma_20'] = sma_20
+            if n >= 26:  # MACD requirements
+                cols['trend_macd'] = macd
+                cols['trend_macd_signal'] = macd_signal
+                cols['trend_macd_diff'] = macd_diff
+            if n >= 20:  # MACD 20 day, only its histogram is reported
+                cols['trend_macd_diff_20'] = macd_diff_20
+            if n >= 20:  # Bollinger Bands requirements
+                cols['volatility_bbhi'] = bb_high_ind
+                cols['volatility_bbh'] = bb_high
+                cols['volatility_bbl'] = bb_low
+                cols['volatility_bbm'] = sma_20
+            if n >= 14:  # RSI requirements
+                cols['momentum_rsi'] = rsi
+            if 'Volume' in cols:
+                cols['volume_obv'] = obv.astype(cols['Volume'].dtype)
+
+            # Warm-up rows are kept: a long warm-up such as the 200-day SMA would otherwise
+            # discard rows where every shorter indicator is valid.
+            self.df = pd.DataFrame(cols, index=history.index)
+            # With Close gap-free, indicators are only NaN over their warm-up, so each
+            # column's last value is its last valid one; columns still warming up are left
+            # out. Reading it from the arrays keeps integer columns such as OBV from being
+            # upcast to float.
+            self._last = {name: values[-1].item() for name, values in cols.items() if not pd.isna(values[-1])}
+            # Volatility and Momentum are only reported for the latest bar, so they go
+            # straight into the snapshot instead of being computed as full columns
+            volatility, momentum = latest_vol_mom(close, 20)
+            if not np.isnan(volatility):
+                self._last['volatility'] = volatility
+                self._last['momentum'] = momentum
+
+            _INDICATOR_CACHE[key] = (self.df, self._last)
+            if len(_INDICATOR_CACHE) > _INDICATOR_CACHE_SIZE:
+                _INDICATOR_CACHE.popitem(last=False)
 
         except Exception as e:
             # Encapsulate the error in a ValueError for consistent error handling.
@@ -138,27 +381,26 @@ class TechAnalyst:
         if self.df is None or self.df.empty:
             raise ValueError("Data not fetched or empty. Call fetch_and_process_data() first.")
 
-        close_prices = self.df['Close'].values
-        peaks, _ = find_peaks(close_prices, distance=20)
-        troughs, _ = find_peaks(-close_prices, distance=20)
-        support_levels = close_prices[troughs][-3:]
-        resistance_levels = close_prices[peaks][-3:]
+        close_prices = self.df['Close'].to_numpy(dtype=np.float64)
+        # Plain floats, so the levels read as numbers rather than np.float64 reprs in the reasoning
+        resistance_levels, support_levels = (levels.tolist() for levels in last_k_extrema(close_prices, 20, 3))
 
         # Extracts the latest, valid indicator values, providing None as a fallback.
+        last = self._last
         indicators = {
-            "current_price": round(self.df['Close'].iloc[-1], 2),
-            "sma_20": round(self.df['trend_sma_20'].iloc[-1], 2) if 'trend_sma_20' in self.df.columns else None,
-            "sma_50": round(self.df['trend_sma_50'].iloc[-1], 2) if 'trend_sma_50' in self.df.columns else None,
-            "sma_200": round(self.df['trend_sma_200'].iloc[-1], 2) if 'trend_sma_200' in self.df.columns else None,
-            "rsi": round(self.df['momentum_rsi'].iloc[-1], 2) if 'momentum_rsi' in self.df.columns else None,
-            "macd": round(self.df['trend_macd_diff'].iloc[-1], 4) if 'trend_macd_diff' in self.df.columns else None,
-            "macd_20": round(self.df['trend_macd_diff_20'].iloc[-1], 4) if 'trend_macd_diff_20' in self.df.columns else None,
-            "obv": self.df['volume_obv'].iloc[-1] if 'volume_obv' in self.df.columns else None,
-            "bollinger_hband": round(self.df['volatility_bbh'].iloc[-1], 2) if 'volatility_bbh' in self.df.columns else None,
+            "current_price": round(last['Close'], 2),
+            "sma_20": round(last['trend_sma_20'], 2) if 'trend_sma_20' in last else None,
+            "sma_50": round(last['trend_sma_50'], 2) if 'trend_sma_50' in last else None,
+            "sma_200": round(last['trend_sma_200'], 2) if 'trend_sma_200' in last else None,
+            "rsi": round(last['momentum_rsi'], 2) if 'momentum_rsi' in last else None,
+            "macd": round(last['trend_macd_diff'], 4) if 'trend_macd_diff' in last else None,
+            "macd_20": round(last['trend_macd_diff_20'], 4) if 'trend_macd_diff_20' in last else None,
+            "obv": last['volume_obv'] if 'volume_obv' in last else None,
+            "bollinger_hband": round(last['volatility_bbh'], 2) if 'volatility_bbh' in last else None,
             "support_levels": [round(level, 2) for level in support_levels],
             "resistance_levels": [round(level, 2) for level in resistance_levels],
-            "volatility": round(self.df['volatility'].iloc[-1], 4) if self.df['volatility'].notna().any() else None,
-            "momentum": round(self.df['momentum'].iloc[-1], 2) if self.df['momentum'].notna().any() else None
+            "volatility": round(last['volatility'], 4) if 'volatility' in last else None,
+            "momentum": round(last['momentum'], 2) if 'momentum' in last else None
         }
         return indicators
 
@@ -167,45 +409,34 @@ class TechAnalyst:
         Analyzes the overall trend of the stock based on SMA indicators.
         The logic remains the same, but it's more robust due to checks for data availability.
         """
-        if 'trend_sma_50' not in self.df.columns or 'trend_sma_200' not in self.df.columns:
+        last = self._last
+        if 'trend_sma_50' not in last or 'trend_sma_200' not in last:
             return "Not enough data for trend analysis"
 
-        current_price = self.df['Close'].iloc[-1]
-        sma_50 = self.df['trend_sma_50'].iloc[-1]
-        sma_200 = self.df['trend_sma_200'].iloc[-1]
-
-        if current_price > sma_50 > sma_200:
-            return "Strong Uptrend"
-        elif current_price > sma_50 and sma_50 < sma_200:
-            return "Potential Uptrend"
-        elif current_price < sma_50 < sma_200:
-            return "Strong Downtrend"
-        elif current_price < sma_50 and sma_50 > sma_200:
-            return "Potential Downtrend"
-        else:
-            return "Neutral"
+        current_price = last['Close']
+        sma_50 = last['trend_sma_50']
+        sma_200 = last['trend_sma_200']
+
+        code = (int(current_price > sma_50) | int(current_price < sma_50) << 1
+                | int(sma_50 > sma_200) << 2 | int(sma_50 < sma_200) << 3)
+        return _TREND_TABLE[code]
 
     def generate_signal(self):
         """
         Generates a trading signal based on a combination of technical indicators.
         The logic is unchanged but benefits from the cleaner data processing pipeline.
         """
-        if 'momentum_rsi' not in self.df.columns or 'trend_macd_diff' not in self.df.columns or 'volatility_bbl' not in self.df.columns:
+        last = self._last
+        if 'momentum_rsi' not in last or 'trend_macd_diff' not in last or 'volatility_bbl' not in last:
             return "Not enough data for signal generation"
 
-        rsi = self.df['momentum_rsi'].iloc[-1]
-        macd = self.df['trend_macd_diff'].iloc[-1]
-        current_price = self.df['Close'].iloc[-1]
-        lower_bb = self.df['volatility_bbl'].iloc[-1]
-        upper_bb = self.df['volatility_bbh'].iloc[-1]
-
-        if rsi < 30 and macd > 0 and current_price < lower_bb:
-            return "Strong Buy"
-        elif rsi < 40 and macd > 0:
-            return "Buy"
-        elif rsi > 70 and macd < 0 and current_price > upper_bb:
-            return "Strong Sell"
-        elif rsi > 60 and macd < 0:
-            return "Sell"
-        else:
-            return "Hold"
+        rsi = last['momentum_rsi']
+        macd = last['trend_macd_diff']
+        current_price = last['Close']
+        lower_bb = last['volatility_bbl']
+        upper_bb = last['volatility_bbh']
+
+        code = (int(rsi < 30) | int(rsi < 40) << 1 | int(rsi > 60) << 2 | int(rsi > 70) << 3
+                | int(macd > 0) << 4 | int(macd < 0) << 5
+                | int(current_price < lower_bb) << 6 | int(current_price > upper_bb) << 7)
+        return _SIGNAL_TABLE[code]
@@ -1,8 +1,26 @@
+import functools
 import streamlit as st
-import json
+import orjson
 import re
 import pandas as pd
 
+from tools._executor import shared_executor
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_DOLLAR_TABLE = str.maketrans({'$': r'\$'})
+_JSON_FENCE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+
+
+def _clean(text):
+    """Strips HTML tags, decodes dollar entities and escapes '$' so Markdown does not render LaTeX."""
+    return _TAG_RE.sub('', text).replace('&dollar;', '$').replace('&#36;', '$').translate(_DOLLAR_TABLE)
+
+def _render_kv(data, key_label='Metric'):
+    """Renders a flat dict as a two-column Streamlit table, keys under key_label."""
+    table = pd.Series(data, name='Value', dtype=object)
+    table.index.name = key_label
+    st.table(table)
+
 def display_agent_outputs(agent_outputs):
     """
     Display CrewAI agent outputs in Streamlit tabs.
@@ -20,12 +38,19 @@ def display_agent_outputs(agent_outputs):
         display_risk_assessment,
         display_investment_strategy
     ]
+    parsed = parse_outputs([agent_outputs.get(name.replace(" ", "_").lower(), None) for name in tab_names])
     tabs = st.tabs(tab_names)
     for i, tab in enumerate(tabs):
         with tab:
-            agent_type = tab_names[i].replace(" ", "_").lower()
-            content = agent_outputs.get(agent_type, None)
-            display_funcs[i](content)
+            display_funcs[i](parsed[i])
+
+def parse_outputs(contents):
+    """
+    Extracts JSON from several agent outputs at once, parsing them on the shared thread pool.
+    The display_* functions accept the parsed objects as-is, so rendering, which has
+    to stay on the Streamlit script thread, does no further parsing.
+    """
+    return list(shared_executor().map(_recursive_extract_json, contents))
 
 def display_generic_agent(content, agent_name="Agent Output"):
     """Display output for unknown agent types."""
@@ -35,8 +60,7 @@ def display_generic_agent(content, agent_name="Agent Output"):
         return
     analysis = _recursive_extract_json(content)
     if isinstance(analysis, dict):
-        df = pd.DataFrame(list(analysis.items()), columns=['Key', 'Value'])
-        st.table(df.set_index('Key'))
+        _render_kv(analysis, 'Key')
     else:
         st.markdown(analysis)
 
@@ -44,28 +68,38 @@ def _recursive_extract_json(content):
     """
     Recursively extracts and parses JSON from a string, handling nested JSON.
     """
-    if isinstance(content, (dict, list)):
-        return content
-    
-    try:
-        # First, try to load the content directly
-        data = json.loads(content)
-        if isinstance(data, str):
-            # If the loaded data is still a string, recurse
-            return _recursive_extract_json(data)
-        return data
-    except (json.JSONDecodeError, TypeError):
-        # If direct loading fails, try to find a JSON blob
-        match = re.search(r'```json\s*([\s\S]*?)\s*```', content)
-        if match:
-            try:
-                data = json.loads(match.group(1))
-                if isinstance(data, str):
-                    return _recursive_extract_json(data)
-                return data
-            except (json.JSONDecodeError, TypeError):
-                return content # Return the raw content if all parsing fails
+    if not isinstance(content, str):
         return content
+    return _extract_json_text(content)
+
+@functools.lru_cache(maxsize=256)
+def _extract_json_text(content):
+    """
+    Parses a string for _recursive_extract_json. Cached because Streamlit reruns
+    render the same task output again; callers must not mutate the result.
+    """
+    # Only strings that can start a JSON document are worth a direct parse;
+    # plain Markdown skips straight to the fenced-block search.
+    if content.lstrip()[:1] in ('{', '[', '"'):
+        try:
+            data = orjson.loads(content)
+            if isinstance(data, str):
+                # If the loaded data is still a string, recurse
+                return _extract_json_text(data)
+            return data
+        except orjson.JSONDecodeError:
+            pass
+    # If direct loading fails, try to find a JSON blob
+    match = _JSON_FENCE.search(content)
+    if match:
+        try:
+            data = orjson.loads(match.group(1))
+            if isinstance(data, str):
+                return _extract_json_text(data)
+            return data
+        except orjson.JSONDecodeError:
+            return content # Return the raw content if all parsing fails
+    return content
 
 def display_technical_analysis(content):
     """Display technical analysis results from the agent"""
@@ -82,8 +116,7 @@ def display_technical_analysis(content):
         st.metric("Signal", analysis.get("signal", "N/A"))
         indicators = analysis.get("indicators", {})
         if isinstance(indicators, dict) and indicators:
-            df = pd.DataFrame(list(indicators.items()), columns=['Indicator', 'Value'])
-            st.table(df.set_index('Indicator'))
+            _render_kv(indicators, 'Indicator')
         elif indicators:
             st.write(indicators)
     elif isinstance(analysis, str):
@@ -103,8 +136,7 @@ def display_fundamental_analysis(content):
             st.markdown(f"**Reasoning:**\n{reasoning}")
         # Remove reasoning from table if present
         table_data = {k: v for k, v in analysis.items() if k != "reasoning"}
-        df = pd.DataFrame(list(table_data.items()), columns=['Metric', 'Value'])
-        st.table(df.set_index('Metric'))
+        _render_kv(table_data, 'Metric')
     elif isinstance(analysis, str):
         st.markdown(analysis)
     # Do not display raw output or error for other types
@@ -123,8 +155,7 @@ def display_risk_assessment(content):
             st.markdown(f"**Reasoning:**\n{reasoning}")
         # Remove reasoning from table if present
         table_data = {k: v for k, v in analysis.items() if k != "reasoning"}
-        df = pd.DataFrame(list(table_data.items()), columns=['Metric', 'Value'])
-        st.table(df.set_index('Metric'))
+        _render_kv(table_data, 'Metric')
     elif isinstance(analysis, str):
         st.markdown(analysis)
     # Do not display raw output or error for other types
@@ -145,14 +176,10 @@ def display_investment_strategy(content):
         st.subheader("Rationale")
         # Only clean rationale if it's a string
         if isinstance(rationale, str):
-            rationale_clean = re.sub(r'<[^>]+>', '', rationale)
-            rationale_clean = rationale_clean.replace('&dollar;', '$').replace('&#36;', '$')
-            rationale_clean = rationale_clean.replace('$', '\$')
-            st.markdown(rationale_clean)
+            st.markdown(_clean(rationale))
         elif isinstance(rationale, dict):
             # Display dict rationale as a table
-            df = pd.DataFrame(list(rationale.items()), columns=["Key", "Value"])
-            st.table(df.set_index("Key"))
+            _render_kv(rationale, "Key")
         else:
             st.write(rationale)
 
@@ -164,29 +191,17 @@ def display_investment_strategy(content):
                     display_dict = {}
                     for k, v in details.items():
                         key = k.replace('_', ' ').capitalize()
-                        val = str(v)
-                        if isinstance(v, str):
-                            val_clean = re.sub(r'<[^>]+>', '', val)
-                            val_clean = val_clean.replace('&dollar;', '$').replace('&#36;', '$')
-                            val_clean = val_clean.replace('$', '\$')
-                        else:
-                            val_clean = val
-                        display_dict[key] = val_clean
-                    df = pd.DataFrame(list(display_dict.items()), columns=["Parameter", "Value"])
-                    for idx, row in df.iterrows():
-                        st.markdown(f"**{row['Parameter']}:** {row['Value']}")
+                        display_dict[key] = _clean(v) if isinstance(v, str) else str(v)
+                    for param, val in display_dict.items():
+                        st.markdown(f"**{param}:** {val}")
                 else:
                     st.write(details)
         elif recommendation:
             st.subheader("Recommendation")
             if isinstance(recommendation, str):
-                rec_clean = re.sub(r'<[^>]+>', '', recommendation)
-                rec_clean = rec_clean.replace('&dollar;', '$').replace('&#36;', '$')
-                rec_clean = rec_clean.replace('$', '\$')
-                st.markdown(rec_clean)
+                st.markdown(_clean(recommendation))
             elif isinstance(recommendation, dict):
-                df = pd.DataFrame(list(recommendation.items()), columns=["Key", "Value"])
-                st.table(df.set_index("Key"))
+                _render_kv(recommendation, "Key")
             else:
                 st.write(recommendation)
     # Do not display raw output or error for other types